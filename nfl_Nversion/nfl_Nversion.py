@@ -1,236 +1,366 @@
 import nflscraPy
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import logging
 import os
+import tempfile
+import time
+
+log = logging.getLogger(__name__)
+
+CACHE_DIR = '.cache'
+# Boxscore scrapes run serially by default. Each game costs three requests and nflscraPy sleeps ~4.5s after
+# each call, so one worker already runs close to the site's ~20 requests/minute limit; more get blocked.
+# Callers with headroom (e.g. a warm boxscore cache) can raise this through NFLGameStats(max_workers=...)
+MAX_WORKERS = 1
+
+
+def _is_fresh(cache_path, ttl):
+    """Checks whether a cache file exists and is younger than ttl seconds."""
+    return os.path.exists(cache_path) and time.time() - os.path.getmtime(cache_path) < ttl
+
+
+# In-process copy of the season scrapes keyed on (season, TTL window); empty scrapes are never kept
+_season_memory = {}
+
+
+def _cached_gamelogs(season, ttl_window):
+    """Scrapes the season gamelogs once per process and TTL window."""
+    key = (season, ttl_window)
+    if key in _season_memory:
+        return _season_memory[key]
+
+    all_games = nflscraPy._gamelogs(season)
+    if not all_games.empty:
+        # Parse the dates once; the parquet cache then stores them typed
+        all_games['event_date'] = pd.to_datetime(all_games['event_date'])
+        _season_memory[key] = all_games
+    return all_games
+
+
+def _write_parquet(frame, cache_path):
+    """Writes a cache file atomically; a failed write is logged and leaves no partial file behind."""
+    cache_dir = os.path.dirname(cache_path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        os.close(fd)
+        try:
+            frame.to_parquet(tmp_path, compression='zstd')
+            os.replace(tmp_path, cache_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    except Exception as e:
+        log.warning("Could not write cache file %s: %s", cache_path, e)
+
+
+# In-process copy of the boxscore cache; like the disk cache it only ever holds non-empty frames
+_boxscore_memory = {}
+
+
+def _disk_cached_boxscore(scraper, kind, game_url):
+    """Reads a boxscore frame from the memory or parquet cache, scraping and storing it on a miss."""
+    key = (kind, game_url)
+    if key in _boxscore_memory:
+        return _boxscore_memory[key]
+
+    slug = os.path.splitext(os.path.basename(game_url))[0]
+    cache_path = os.path.join(CACHE_DIR, 'boxscores', f'{kind}_{slug}.parquet')
+    if os.path.exists(cache_path):
+        try:
+            frame = pd.read_parquet(cache_path)
+            _boxscore_memory[key] = frame
+            return frame
+        except Exception as e:
+            # Unreadable cache files never expire on their own, so drop this one and scrape again
+            log.warning("Discarding unreadable cache file %s: %s", cache_path, e)
+            os.remove(cache_path)
+
+    frame = scraper(game_url)
+    if not frame.empty:  # Only finished scrapes are cached, so empty (rate-limited) results are retried
+        _boxscore_memory[key] = frame
+        _write_parquet(frame, cache_path)
+    return frame
+
+
+def _cached_gamelog_metadata(game_url):
+    """Returns the gamelog metadata for a boxscore, cached in memory and on disk."""
+    return _disk_cached_boxscore(nflscraPy._gamelog_metadata, 'metadata', game_url)
+
+
+def _cached_gamelog_statistics(game_url):
+    """Returns the gamelog statistics for a boxscore, cached in memory and on disk."""
+    return _disk_cached_boxscore(nflscraPy._gamelog_statistics, 'statistics', game_url)
+
 
 class NFLGameStats:
-    def __init__(self, week=None):
+    # Team statistics kept from each boxscore, in output column order
+    TEAM_COLS = [
+        'rush_att', 'rush_yds', 'rush_tds',
+        'pass_cmp', 'pass_att', 'pass_yds', 'pass_tds', 'pass_int', 'passer_rating', 'net_pass_yds',
+        'total_yds', 'times_sacked', 'yds_sacked_for',
+        'fumbles', 'fumbles_lost', 'turnovers',
+        'penalties', 'penalty_yds', 'first_downs',
+        'third_down_conv', 'third_down_att', 'third_down_conv_pct',
+        'fourth_down_conv', 'fourth_down_att', 'fourth_down_conv_pct',
+        'time_of_possession',
+    ]
+
+    # Game metadata kept from each boxscore
+    META_NUM_COLS = ['tm_spread', 'opp_spread', 'total', 'attendance', 'duration',
+                     'temperature', 'humidity_pct', 'wind_speed']
+    META_STR_COLS = ['roof_type', 'surface_type']
+
+    # Output columns and their dtypes; rows are stored as tuples in this order
+    SCHEMA = {
+        'team': 'string',
+        **dict.fromkeys(TEAM_COLS, np.float32),
+        'tm_spread': np.float32, 'opp_spread': np.float32, 'total': np.float32,
+        'attendance': np.float32, 'duration': np.float32,
+        'roof_type': 'string', 'surface_type': 'string',
+        'temperature': np.float32, 'humidity_pct': np.float32, 'wind_speed': np.float32,
+        'tm_location': 'string', 'opp_location': 'string',
+        'tm_score': 'Int64', 'opp_score': 'Int64',
+        'opponent': 'string',
+    }
+
+    SEASON_START = pd.Timestamp('2024-09-05')  # Season starts on Thursday, 2024-09-05
+
+    def __init__(self, week=None, cache_ttl_hours=6, week_cache_ttl_hours=1, max_workers=MAX_WORKERS):
         """Initialize the object with a week number or default to the current week."""
         self.week = week if week else self.get_current_week()
-        self.current_season = datetime.today().year
+        self.current_season = self.get_current_season()
         self.team_stats_list = []
-        self.season_start = datetime(2024, 9, 5)  # Season starts on Thursday, 2024-09-05
+        self.cache_ttl = cache_ttl_hours * 3600  # Seconds before the cached season gamelogs are refreshed
+        self.week_cache_ttl = week_cache_ttl_hours * 3600  # Seconds before the cached week table is rebuilt
+        self.max_workers = max_workers  # Boxscore scrapes in flight; 1 (serial) stays under the rate limit
+
+    @classmethod
+    def get_current_season(cls):
+        """Determines the current season from today's date."""
+        return pd.Timestamp.today().year
 
-    def get_current_week(self):
+    @classmethod
+    def get_current_week(cls):
         """Determines the current NFL week based on today's date."""
-        today = datetime.today()
-        days_since_start = (today - self.season_start).days
-        current_week = days_since_start // 7 + 1
-        return current_week
+        days_since_start = (pd.Timestamp.today().normalize() - cls.SEASON_START).days
+        return days_since_start // 7 + 1
 
     def get_week_start_date(self):
         """Calculates the Thursday date for the given week."""
-        return self.season_start + timedelta(weeks=self.week - 1)
+        return self.SEASON_START + timedelta(weeks=self.week - 1)
+
+    def _load_season(self):
+        """Loads the season gamelogs from the local parquet cache, scraping them again once the cache is stale."""
+        cache_path = os.path.join(CACHE_DIR, f'gamelogs_{self.current_season}.parquet')
+        if _is_fresh(cache_path, self.cache_ttl):
+            return pd.read_parquet(cache_path)
+
+        # The TTL window index keeps long-lived processes from serving a stale in-memory copy
+        all_games = _cached_gamelogs(self.current_season, int(time.time() // max(self.cache_ttl, 1)))
+        if not all_games.empty:
+            _write_parquet(all_games, cache_path)
+        return all_games
+
+    def _week_cache_path(self):
+        """Returns the parquet cache path for this season and week's final table."""
+        return os.path.join(CACHE_DIR, f'nfl_{self.current_season}_wk{self.week}.parquet')
 
     def fetch_games(self):
-        """Fetches the games for the given week, from Thursday to Monday."""
+        """Fetches the games for the given week, from Thursday to Monday, and returns the stats table."""
+        cache_path = self._week_cache_path()
+        if _is_fresh(cache_path, self.week_cache_ttl):
+            log.info("Loading week %s from %s", self.week, cache_path)
+            df = pd.read_parquet(cache_path)
+            self.write_csv(df)
+            return df
+
         start_date = self.get_week_start_date()
         end_date = start_date + timedelta(days=4)  # Monday is 4 days after Thursday
 
-        print(f"Fetching games from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')} for week {self.week}.")
+        # Logging renders the dates lazily, only when the message is emitted
+        log.info("Fetching games from %s to %s for week %s.", start_date.date(), end_date.date(), self.week)
 
         try:
-            # Using _gamelogs to fetch the game logs for the season
-            all_games = nflscraPy._gamelogs(self.current_season)
+            # Season game logs are served from the local cache when fresh
+            all_games = self._load_season()
         except Exception as e:
-            print(f"Error fetching game logs: {e}")
+            log.error("Error fetching game logs: %s", e)
+            return
+
+        if all_games.empty:  # nflscraPy returns an empty frame on any non-200 response
+            log.warning("Season %s gamelog scrape returned no data; the site may be rate limiting requests.",
+                        self.current_season)
             return
 
         # Filter games for the date range (Thursday to Monday)
-        games_in_week = all_games[(all_games['event_date'] >= start_date.strftime('%Y-%m-%d')) & 
-                                  (all_games['event_date'] <= end_date.strftime('%Y-%m-%d'))]
+        games_in_week = all_games.loc[all_games['event_date'].between(start_date, end_date)]
 
         if games_in_week.empty:
-            print(f"No games scheduled from {start_date} to {end_date}.")
+            log.info("No games scheduled from %s to %s.", start_date.date(), end_date.date())
             return
 
-        print(f"Fetching data for {len(games_in_week)} games happening in week {self.week}")
+        log.info("Fetching data for %d games happening in week %s", len(games_in_week), self.week)
         
-        # Loop over games and fetch detailed stats
-        for idx, game in games_in_week.iterrows():
-            self.process_game(game)
+        # Scrape the boxscores on max_workers threads (serial by default), processing results in schedule order here
+        skipped = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for payload in executor.map(self._fetch_game_payload, games_in_week.itertuples(index=False)):
+                if not self.process_game(*payload):
+                    skipped += 1
+
+        if skipped:
+            log.warning("%d of %d games in week %s produced no stats; the week will not be cached.",
+                        skipped, len(games_in_week), self.week)
+
+        # Convert the stats list to a DataFrame and display; only a complete week is cached
+        return self.display_stats(cache_week=not skipped)
+
+    def _fetch_game_payload(self, game):
+        """Scrapes the raw metadata and statistics frames for a single game."""
+        game_url = game.boxscore_stats_link
+        try:
+            gamelog_metadata = _cached_gamelog_metadata(game_url)
+        except Exception as e:
+            log.warning("Metadata not available for %s: %s", game_url, e)
+            return game, None, None
+        if gamelog_metadata.empty:  # nflscraPy returns an empty frame on any non-200 response
+            log.warning("Metadata scrape for %s returned no data; the site may be rate limiting requests.", game_url)
+            return game, None, None
+
+        try:
+            gamelog_statistics = _cached_gamelog_statistics(game_url)
+        except Exception as e:
+            log.warning("Statistics not available for %s: %s", game_url, e)
+            return game, gamelog_metadata, None
+        if gamelog_statistics.empty:
+            log.warning("Statistics scrape for %s returned no data; the site may be rate limiting requests.", game_url)
+            return game, gamelog_metadata, None
+
+        return game, gamelog_metadata, gamelog_statistics
 
-        # Convert the stats list to a DataFrame and display
-        self.display_stats()
+    def process_game(self, game, gamelog_metadata, gamelog_statistics):
+        """Processes a single game from its scraped statistics and metadata; returns whether rows were added."""
+        if log.isEnabledFor(logging.INFO):
+            banner = '~' * 100
+            log.info("\n%s\nProcessing game between %s and %s on %s\n%s",
+                     banner, game.tm_name, game.opp_name, f"{game.event_date:%Y-%m-%d}", banner)
 
-    def process_game(self, game):
-        """Processes a single game and fetches statistics and metadata."""
-        game_url = game['boxscore_stats_link']
-        print(f"\n~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
-        print(f"Processing game between {game['tm_name']} and {game['opp_name']} on {game['event_date']}")
-        print(f"~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
+        if gamelog_metadata is None or gamelog_statistics is None:
+            # The scrape itself failed and was already logged; the game may well have been played
+            return False
 
-        # Fetch statistics and metadata
-        team1_stats, team2_stats, metadata = self.extract_game_statistics(game_url, game['tm_name'], game['opp_name'])
+        # Extract statistics and metadata
+        team1_stats, team2_stats, metadata = self.extract_game_statistics(gamelog_metadata, gamelog_statistics,
+                                                                          game.tm_name, game.opp_name)
 
         if team1_stats and team2_stats:
             # Process and add stats
             self.process_stats(game, team1_stats, team2_stats, metadata)
-        else:
-            print(f"Game between {game['tm_name']} and {game['opp_name']} has no stats available yet.")
-
-    def extract_game_statistics(self, game_url, team1_name, team2_name):
-        """Extracts game statistics for both teams and metadata."""
-        try:
-            gamelog_metadata = nflscraPy._gamelog_metadata(game_url)  # Using private method
-        except Exception as e:
-            print(f"Metadata not available for {game_url}: {e}")
-            return None, None, {}
+            return True
 
-        try:
-            gamelog_statistics = nflscraPy._gamelog_statistics(game_url)  # Using private method
-        except Exception as e:
-            print(f"Statistics not available for {game_url}: {e}")
-            return None, None, {}
+        log.info("Game between %s and %s has no stats available yet.", game.tm_name, game.opp_name)
+        return False
 
+    def extract_game_statistics(self, gamelog_metadata, gamelog_statistics, team1_name, team2_name):
+        """Extracts game statistics for both teams and metadata."""
         # Ensure that team1_stats corresponds to team1_name and team2_stats to team2_name
         if 'market' in gamelog_statistics.columns:
-            if gamelog_statistics.iloc[0]['market'] == team1_name:
-                team1_stats = self.extract_team_stats(gamelog_statistics.iloc[0], team1_name)
-                team2_stats = self.extract_team_stats(gamelog_statistics.iloc[1], team2_name)
-            else:
-                team1_stats = self.extract_team_stats(gamelog_statistics.iloc[1], team1_name)
-                team2_stats = self.extract_team_stats(gamelog_statistics.iloc[0], team2_name)
+            markets = gamelog_statistics['market'].to_numpy()
+            i1 = 0 if markets[0] == team1_name else 1
+
+            # Order both rows and select every tracked stat column in one pass; missing columns and values become 0
+            stats_df = gamelog_statistics.iloc[[i1, 1 - i1]].reindex(columns=self.TEAM_COLS).fillna(0)
+            team1_stats, team2_stats = stats_df.to_dict('records')
         else:
-            print("The 'market' column is missing. Please check the column names.")
+            log.warning("The 'market' column is missing. Please check the column names.")
             return None, None, {}
 
         metadata = self.extract_game_metadata(gamelog_metadata)
         return team1_stats, team2_stats, metadata
 
-    def extract_team_stats(self, team_data, team_name):
-        """Extracts specific team statistics."""
-        return {
-            'team': team_name,
-            'rush_att': team_data.get('rush_att', 0),
-            'rush_yds': team_data.get('rush_yds', 0),
-            'rush_tds': team_data.get('rush_tds', 0),
-            'pass_cmp': team_data.get('pass_cmp', 0),
-            'pass_att': team_data.get('pass_att', 0),
-            'pass_yds': team_data.get('pass_yds', 0),
-            'pass_tds': team_data.get('pass_tds', 0),
-            'pass_int': team_data.get('pass_int', 0),
-            'passer_rating': team_data.get('passer_rating', 0),
-            'net_pass_yds': team_data.get('net_pass_yds', 0),
-            'total_yds': team_data.get('total_yds', 0),
-            'times_sacked': team_data.get('times_sacked', 0),
-            'yds_sacked_for': team_data.get('yds_sacked_for', 0),
-            'fumbles': team_data.get('fumbles', 0),
-            'fumbles_lost': team_data.get('fumbles_lost', 0),
-            'turnovers': team_data.get('turnovers', 0),
-            'penalties': team_data.get('penalties', 0),
-            'penalty_yds': team_data.get('penalty_yds', 0),
-            'first_downs': team_data.get('first_downs', 0),
-            'third_down_conv': team_data.get('third_down_conv', 0),
-            'third_down_att': team_data.get('third_down_att', 0),
-            'third_down_conv_pct': team_data.get('third_down_conv_pct', 0),
-            'fourth_down_conv': team_data.get('fourth_down_conv', 0),
-            'fourth_down_att': team_data.get('fourth_down_att', 0),
-            'fourth_down_conv_pct': team_data.get('fourth_down_conv_pct', 0),
-            'time_of_possession': team_data.get('time_of_possession', "00:00"),
-        }
-
     def extract_game_metadata(self, metadata):
-        """Extracts specific metadata from the game."""
-        cleaned_metadata = {
-            'tm_spread': self.clean_value(metadata.get('tm_spread', 0)),
-            'opp_spread': self.clean_value(metadata.get('opp_spread', 0)),
-            'total': self.clean_value(metadata.get('total', 0)),
-            'attendance': self.clean_value(metadata.get('attendance', 0)),
-            'duration': self.clean_value(metadata.get('duration', 0)),
-            'roof_type': self.clean_value(metadata.get('roof_type', '0'), expected_type='string'),  # Ensure strings are handled
-            'surface_type': self.clean_value(metadata.get('surface_type', '0'), expected_type='string'),  # Ensure strings are handled
-            'temperature': self.clean_value(metadata.get('temperature', 0)),
-            'humidity_pct': self.clean_value(metadata.get('humidity_pct', 0)),
-            'wind_speed': self.clean_value(metadata.get('wind_speed', 0)),
-        }
-        return cleaned_metadata
-
-
-
-    def clean_value(self, value, expected_type=None):
-        """Cleans individual values by removing leading zeros and replacing None/NaN/N/A with 0."""
-        if isinstance(value, pd.Series):
-            # If value is a Series, extract the first element
-            value = value.iloc[0] if not value.empty else None
-        if pd.isna(value) or value in [None, 'N/A', 'None', '']:  # Handle NaN, None, empty, etc.
-            return '0' if expected_type == 'string' else 0
-        if isinstance(value, str):
-            return value.strip() if value.strip() else '0'  # Remove leading/trailing spaces
-        return float(value)  # Convert to float if it's a number
+        """Extracts the raw metadata values from the game; they are cleaned in display_stats."""
+        row = metadata.iloc[0]
+        return {col: row.get(col) for col in self.META_NUM_COLS + self.META_STR_COLS}
 
     def process_stats(self, game, team1_stats, team2_stats, metadata):
         """Helper function to process and add the stats for both teams."""
-        tm_location = game['tm_location']
-        opp_location = game['opp_location']
-        tm_score = game['tm_score']
-        opp_score = game['opp_score']
-
-        # Create metadata for both perspectives (team1, team2)
-        metadata_team1 = metadata.copy()
-        metadata_team2 = metadata.copy()
-
-        if tm_location == 'H':  # Tm is home
-            metadata_team1['tm_spread'] = metadata['tm_spread']
-            metadata_team1['opp_spread'] = metadata['opp_spread']
-            metadata_team2['tm_spread'] = metadata['opp_spread']
-            metadata_team2['opp_spread'] = metadata['tm_spread']
-        else:  # Tm is away
-            metadata_team1['tm_spread'] = metadata['opp_spread']
-            metadata_team1['opp_spread'] = metadata['tm_spread']
-            metadata_team2['tm_spread'] = metadata['tm_spread']
-            metadata_team2['opp_spread'] = metadata['opp_spread']
-
-        metadata_team1.update({
+        tm_location = game.tm_location
+        opp_location = game.opp_location
+        tm_score = game.tm_score
+        opp_score = game.opp_score
+
+        # Spreads are scraped from the home side; swap them once if tm is away
+        tm_spread, opp_spread = metadata['tm_spread'], metadata['opp_spread']
+        if tm_location != 'H':
+            tm_spread, opp_spread = opp_spread, tm_spread
+
+        # Build the metadata for both perspectives (team1, team2) directly
+        metadata_team1 = {
+            **metadata,
+            'tm_spread': tm_spread,
+            'opp_spread': opp_spread,
             'tm_location': tm_location,
             'opp_location': opp_location,
             'tm_score': tm_score,
             'opp_score': opp_score
-        })
+        }
 
-        metadata_team2.update({
+        metadata_team2 = {
+            **metadata,
+            'tm_spread': opp_spread,
+            'opp_spread': tm_spread,
             'tm_location': opp_location,
             'opp_location': tm_location,
             'tm_score': opp_score,
             'opp_score': tm_score
-        })
-
-        # Clean stats before adding
-        team1_stats = self.clean_stats(team1_stats)
-        team2_stats = self.clean_stats(team2_stats)
-
-        # Add both perspectives
-        team1_stats.update(metadata_team1)
-        team1_stats['team'] = game['tm_name']
-        team1_stats['opponent'] = game['opp_name']
-        self.team_stats_list.append(team1_stats)
-
-        team2_stats.update(metadata_team2)
-        team2_stats['team'] = game['opp_name']
-        team2_stats['opponent'] = game['tm_name']
-        self.team_stats_list.append(team2_stats)
-
-    def clean_stats(self, stats):
-        """Removes leading zeros, handles NaN values, and formats the values correctly."""
-        cleaned_stats = {}
-        for key, value in stats.items():
-            cleaned_stats[key] = self.clean_value(value)  # Use clean_value method to handle cleaning
-        return cleaned_stats
-
-    def display_stats(self):
-        """Displays the collected statistics in DataFrame format and exports to Excel."""
+        }
+
+        # Add both perspectives, setting team/opponent exactly once per row
+        row1 = {'team': game.tm_name, 'opponent': game.opp_name, **team1_stats, **metadata_team1}
+        self.team_stats_list.append(tuple(row1[col] for col in self.SCHEMA))
+
+        row2 = {'team': game.opp_name, 'opponent': game.tm_name, **team2_stats, **metadata_team2}
+        self.team_stats_list.append(tuple(row2[col] for col in self.SCHEMA))
+
+    def display_stats(self, cache_week=True):
+        """Collects the statistics into a DataFrame, caches it when complete and exports it to CSV."""
         if not self.team_stats_list:
-            print("No data available to display yet, but some games may still be in progress.")
+            log.info("No data available to display yet, but some games may still be in progress.")
             return
 
-        df = pd.DataFrame(self.team_stats_list)
+        df = pd.DataFrame.from_records(self.team_stats_list, columns=list(self.SCHEMA))
 
-        # Save the DataFrame to CSV
+        # Clean the scraped columns in bulk: unparseable numbers become 0, blank strings become '0'
+        num_cols = self.TEAM_COLS + self.META_NUM_COLS
+        df[num_cols] = df[num_cols].apply(pd.to_numeric, errors='coerce').fillna(0)
+        df[self.META_STR_COLS] = df[self.META_STR_COLS].apply(
+            lambda col: col.str.strip().replace(['N/A', 'None', ''], '0').fillna('0'))
+        df = df.astype(self.SCHEMA)
+
+        # Cache the typed table so reruns of this week skip the scrape entirely
+        if cache_week:
+            _write_parquet(df, self._week_cache_path())
+
+        self.write_csv(df)
+        return df
+
+    def write_csv(self, df):
+        """Saves the DataFrame to CSV with Arrow's columnar writer."""
         csv_filename = f'nfl_game_stats_week_{self.week}.csv'
-        df.to_csv(csv_filename, index=False)
-        print(f"Data saved to {csv_filename}")
+        pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), csv_filename)
+        log.info("Data saved to %s", csv_filename)
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
 
-# Example usage:
-week = 1  # Set the week number you want to fetch
-nfl_stats = NFLGameStats(week=week)
-nfl_stats.fetch_games()
+    # Example usage:
+    week = 1  # Set the week number you want to fetch
+    nfl_stats = NFLGameStats(week=week)
+    nfl_stats.fetch_games()